@@ -3,7 +3,7 @@
 import streamlit as st
 import pandas as pd
 
-from scoring import load_rubric, score_transcript
+from scoring import build_rubric, load_model, load_rubric, score_transcript
 
 # -------------------- File Paths -------------------- #
 RUBRIC_PATH = "data/rubric.xlsx"
@@ -16,6 +16,20 @@ def get_rubric_df():
     return load_rubric(RUBRIC_PATH)
 
 
+@st.cache_resource
+def get_model():
+    # Deferred until the first scoring click, so the first page render
+    # never blocks on pulling the encoder.
+    return load_model()
+
+
+@st.cache_resource
+def get_scoring_rubric():
+    # The rubric never changes within a session, so resolve its columns
+    # and encode its descriptions once instead of on every "Score" click.
+    return build_rubric(get_rubric_df(), model=get_model())
+
+
 @st.cache_data
 def load_sample_transcript():
     try:
@@ -68,7 +82,9 @@ to get a rubric-based evaluation **(0–100)** with per-criterion feedback.
             return
 
         with st.spinner("Scoring transcript..."):
-            result = score_transcript(transcript_input, rubric_df)
+            result = score_transcript(
+                transcript_input, get_scoring_rubric(), model=get_model()
+            )
 
         st.success("Scoring complete!")
 
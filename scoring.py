@@ -9,24 +9,196 @@ Scoring logic for Nirmaan – Spoken Introduction Tool.
 - Produces per-criterion + overall score
 """
 
-from typing import Dict, Any, List
+import os
+
+# Configure CPU threading BEFORE torch / transformers are imported:
+# sentence-transformers often ends up effectively single-threaded in
+# container deploys, leaving most cores idle during the forward pass.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
 import re
 
 import numpy as np
 import pandas as pd
 
+try:
+    import torch
+
+    torch.set_num_threads(os.cpu_count() or 1)
+    torch.set_num_interop_threads(2)
+except (ImportError, RuntimeError):
+    # Interop threads can only be set once per process; a re-import
+    # (e.g. a Streamlit reload) keeps whatever was configured first.
+    pass
+
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the kernel below still runs as a plain Python loop.
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
 
 
 # ---------------------------------------------------------
-# Global model – loaded once
+# Shared model – loaded lazily, once
 # ---------------------------------------------------------
-try:
-    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-except Exception as e:
-    model = None
-    print("WARNING: could not load sentence-transformers model:", e)
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class OnnxEncoder:
+    """
+    MiniLM encoder backed by an int8-quantized ONNX Runtime session.
+
+    Exports and dynamically quantizes the model once (cached on disk),
+    then serves an encode() compatible with the SentenceTransformer
+    call sites in this module: tokenize, mean-pool over the attention
+    mask, optionally L2-normalize.
+    """
+
+    def __init__(self, model_name: str = MODEL_NAME, cache_dir=None):
+        from pathlib import Path
+
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "nirmaan-scoring" / "minilm-int8"
+        cache_dir = Path(cache_dir)
+
+        if not (cache_dir / "model_quantized.onnx").exists():
+            onnx_model = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True
+            )
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            quantizer.quantize(
+                save_dir=cache_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(
+                    is_static=False
+                ),
+            )
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.session = ORTModelForFeatureExtraction.from_pretrained(
+            cache_dir, file_name="model_quantized.onnx"
+        )
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            batch = sentences[start : start + batch_size]
+            enc = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=256,
+                return_tensors="np",
+            )
+            hidden = self.session(**enc).last_hidden_state
+            mask = enc["attention_mask"][:, :, None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(
+                mask.sum(axis=1), 1e-9, None
+            )
+            batches.append(pooled)
+
+        embeddings = np.concatenate(batches, axis=0)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings
+
+
+def _load_model():
+    """Prefer the int8 ONNX encoder; fall back to plain SentenceTransformer."""
+    try:
+        return OnnxEncoder()
+    except Exception as e:
+        print("WARNING: int8 ONNX encoder unavailable, falling back:", e)
+
+    try:
+        return SentenceTransformer(MODEL_NAME)
+    except Exception as e:
+        print("WARNING: could not load sentence-transformers model:", e)
+        return None
+
+
+# Single worker used to overlap the transcript encode (torch/onnxruntime
+# release the GIL during the forward pass) with the Python-side keyword
+# work in score_transcript.
+_encode_executor = ThreadPoolExecutor(max_workers=1)
+
+# Most recent transcript embeddings, keyed by (model, text). Tokenizing
+# and embedding the same 500-word transcript on every rerun is pure
+# waste; a handful of entries covers the repeated-click case.
+_TRANSCRIPT_CACHE_SIZE = 8
+_transcript_emb_cache: OrderedDict = OrderedDict()
+
+
+def _encode_transcript(model, transcript: str) -> np.ndarray:
+    """
+    Embed one transcript, memoizing the last few results so re-scoring
+    an unchanged transcript skips tokenization and the transformer
+    forward pass entirely.
+    """
+    key = (id(model), transcript)
+    emb = _transcript_emb_cache.get(key)
+
+    if emb is None:
+        emb = model.encode(
+            [transcript],
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )[0]
+        _transcript_emb_cache[key] = emb
+        if len(_transcript_emb_cache) > _TRANSCRIPT_CACHE_SIZE:
+            _transcript_emb_cache.popitem(last=False)
+    else:
+        _transcript_emb_cache.move_to_end(key)
+
+    return emb
+
+
+# Loaded lazily on first use so importing this module (and rendering the
+# app's first page) doesn't block on pulling the ~80 MB encoder.
+_model = None
+_model_load_failed = False
+
+
+def load_model():
+    """
+    Return the shared encoder instance, loading it on first call.
+    Returns None if no encoder could be loaded (scoring then degrades to
+    neutral semantic scores). Callers may also wrap this in
+    st.cache_resource to share the instance across Streamlit sessions.
+    """
+    global _model, _model_load_failed
+
+    if _model is None and not _model_load_failed:
+        _model = _load_model()
+        _model_load_failed = _model is None
+
+    return _model
 
 
 # ---------------------------------------------------------
@@ -52,7 +224,22 @@ def load_rubric(path: str) -> pd.DataFrame:
       - MinWords / Min Words             → minimum word count (optional)
       - MaxWords / Max Words             → maximum word count (optional)
     """
-    df = pd.read_excel(path)
+    # Explicit dtypes skip pandas type inference on the numeric columns.
+    dtypes = {
+        "Weight": "float64",
+        "MinWords": "float64",
+        "Min Words": "float64",
+        "MaxWords": "float64",
+        "Max Words": "float64",
+    }
+
+    try:
+        # The Rust-based calamine engine parses XLSX much faster than the
+        # default openpyxl.
+        df = pd.read_excel(path, engine="calamine", dtype=dtypes)
+    except ImportError:
+        df = pd.read_excel(path, dtype=dtypes)
+
     df.columns = [str(c).strip() for c in df.columns]
 
     # Drop completely empty rows (if any)
@@ -61,23 +248,19 @@ def load_rubric(path: str) -> pd.DataFrame:
     return df
 
 
-def compute_keyword_score(transcript: str, keyword_str: str) -> Dict[str, Any]:
-    """Return coverage (0–1) and lists of found/missing keywords."""
-    transcript_lower = transcript.lower()
-    keywords = [
+def _parse_keywords(keyword_str: str) -> List[str]:
+    """Split a comma-separated keyword cell into lowercase keywords."""
+    return [
         k.strip().lower()
         for k in str(keyword_str).split(",")
         if str(k).strip()
     ]
 
-    found = []
-    missing = []
 
-    for kw in keywords:
-        if kw and kw in transcript_lower:
-            found.append(kw)
-        else:
-            missing.append(kw)
+def _coverage_result(keywords: List[str], found_set) -> Dict[str, Any]:
+    """Build the coverage dict from a precomputed set of found keywords."""
+    found = [kw for kw in keywords if kw in found_set]
+    missing = [kw for kw in keywords if kw not in found_set]
 
     if len(keywords) == 0:
         coverage = 1.0
@@ -91,6 +274,114 @@ def compute_keyword_score(transcript: str, keyword_str: str) -> Dict[str, Any]:
     }
 
 
+# Tokens as they appear in a lowercased transcript
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _find_all_keywords(
+    transcript_lower: str,
+    keyword_lists: List[List[str]],
+) -> List[set]:
+    """
+    Find which of each criterion's keywords occur in the transcript.
+
+    Single-token keywords are checked against a token set built from the
+    transcript in one pass — a C-level set membership test per keyword,
+    no substring scans. Multi-word (or punctuated) keywords go through
+    one shared substring scan (_find_substring_keywords).
+    """
+    found: List[set] = [set() for _ in keyword_lists]
+    transcript_tokens = set(_TOKEN_RE.findall(transcript_lower))
+
+    substring_lists: List[List[str]] = []
+    for idx, keywords in enumerate(keyword_lists):
+        substring_kws = []
+        for kw in keywords:
+            if not kw:
+                continue
+            if _TOKEN_RE.fullmatch(kw):
+                if kw in transcript_tokens:
+                    found[idx].add(kw)
+            else:
+                substring_kws.append(kw)
+        substring_lists.append(substring_kws)
+
+    if any(substring_lists):
+        for idx, hits in enumerate(
+            _find_substring_keywords(transcript_lower, substring_lists)
+        ):
+            found[idx] |= hits
+
+    return found
+
+
+def _find_substring_keywords(
+    transcript_lower: str,
+    keyword_lists: List[List[str]],
+) -> List[set]:
+    """
+    Substring-match each criterion's keywords against the transcript.
+
+    When pyahocorasick is available, builds one automaton over the union
+    of all rubric keywords and scans the transcript a single time,
+    instead of one substring scan per keyword per criterion. Falls back
+    to a single precompiled regex alternation otherwise.
+    """
+    found: List[set] = [set() for _ in keyword_lists]
+
+    if ahocorasick is not None:
+        # The same keyword can appear under several criteria, so map each
+        # word to every criterion index that owns it.
+        owners: Dict[str, List[int]] = {}
+        for idx, keywords in enumerate(keyword_lists):
+            for kw in keywords:
+                owners.setdefault(kw, []).append(idx)
+
+        if owners:
+            automaton = ahocorasick.Automaton()
+            for kw, idxs in owners.items():
+                automaton.add_word(kw, (kw, idxs))
+            automaton.make_automaton()
+
+            for _, (kw, idxs) in automaton.iter(transcript_lower):
+                for idx in idxs:
+                    found[idx].add(kw)
+    else:
+        # One alternation of escaped literals scanned once, instead of a
+        # substring pass per keyword. The zero-width lookahead keeps
+        # overlapping hits; a keyword shadowed by a longer alternative
+        # starting at the same position is recovered from the hit texts,
+        # so the match semantics stay identical to plain substring search.
+        unique_kws = sorted(
+            {kw for keywords in keyword_lists for kw in keywords if kw},
+            key=len,
+            reverse=True,
+        )
+        if unique_kws:
+            pattern = re.compile(
+                r"(?=(" + "|".join(re.escape(kw) for kw in unique_kws) + r"))"
+            )
+            hits = set(pattern.findall(transcript_lower))
+            for idx, keywords in enumerate(keyword_lists):
+                for kw in keywords:
+                    if kw in hits or any(kw in hit for hit in hits):
+                        found[idx].add(kw)
+
+    return found
+
+
+def compute_keyword_score(transcript_lower: str, keyword_str: str) -> Dict[str, Any]:
+    """
+    Return coverage (0–1) and lists of found/missing keywords.
+
+    Expects an already-lowercased transcript so callers scoring many
+    criteria lowercase (one O(n) string copy) only once.
+    """
+    keywords = _parse_keywords(keyword_str)
+    found_set = _find_all_keywords(transcript_lower, [keywords])[0]
+    return _coverage_result(keywords, found_set)
+
+
 def compute_length_penalty(
     word_count: int,
     min_words: float,
@@ -123,117 +414,337 @@ def compute_length_penalty(
     return {"penalty": float(penalty), "suggestion": suggestion}
 
 
-def compute_semantic_score(transcript: str, rubric_description: str) -> float:
+@njit(cache=True)
+def _length_penalty_and_combine(
+    word_count: float,
+    min_words: np.ndarray,
+    max_words: np.ndarray,
+    kw_scores: np.ndarray,
+    sem_scores: np.ndarray,
+    weights: np.ndarray,
+):
+    """
+    Vectorized length penalty + score combination over all criteria.
+
+    Same arithmetic as compute_length_penalty plus the 50/50 blend and
+    weighting, but as one native loop (numba-compiled when available)
+    instead of per-row Python float dispatch.
+    """
+    n = kw_scores.shape[0]
+    penalties = np.empty(n)
+    finals = np.empty(n)
+    weighted_sum = 0.0
+    total_weight = 0.0
+
+    for i in range(n):
+        penalty = 1.0
+        if np.isfinite(min_words[i]) and word_count < min_words[i]:
+            diff = min_words[i] - word_count
+            penalty = max(0.4, 1.0 - diff / max(min_words[i], 1.0))
+        elif np.isfinite(max_words[i]) and word_count > max_words[i]:
+            diff = word_count - max_words[i]
+            penalty = max(0.4, 1.0 - diff / max(max_words[i], 1.0))
+
+        penalties[i] = penalty
+        finals[i] = (0.5 * kw_scores[i] + 0.5 * sem_scores[i]) * penalty
+        weighted_sum += finals[i] * weights[i]
+        total_weight += weights[i]
+
+    return penalties, finals, weighted_sum, total_weight
+
+
+def compute_semantic_score(
+    transcript: str,
+    rubric_description: str,
+    model=None,
+) -> float:
     """
     Semantic similarity (0–1) between transcript and criterion description.
-    If model is missing, default to 0.5 (neutral).
+    If no model can be loaded, default to 0.5 (neutral).
     """
+    # An empty/NaN description carries no signal — return the neutral
+    # score without spending a transformer forward pass on it.
+    description = (
+        "" if pd.isna(rubric_description) else str(rubric_description).strip()
+    )
+    if not description:
+        return 0.5
+
+    if model is None:
+        model = load_model()
     if model is None:
         return 0.5
 
-    sentences = [str(transcript), str(rubric_description)]
-    embeddings = model.encode(sentences)
-    sim = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
-    # cosine similarity -1..1 → 0..1
-    sim = (sim + 1) / 2
-    return float(sim)
+    sentences = [str(transcript), description]
+    embeddings = model.encode(sentences, normalize_embeddings=True)
+    a, b = embeddings[0], embeddings[1]
+    # Embeddings are unit-norm, so cosine is a plain dot product —
+    # no 2D wrapping or sklearn pairwise machinery needed.
+    # cosine similarity -1..1 → 0..1, as a single multiply-add
+    return 0.5 * float(np.dot(a, b)) + 0.5
 
 
 # ---------------------------------------------------------
 # Main scoring pipeline
 # ---------------------------------------------------------
-def _get_criterion_name(row: pd.Series) -> str:
-    """Try to pick a nice human-readable name from the row."""
-    # Try a few common column names
-    for col in ["Criterion", "Criteria", "Parameter", "Aspect"]:
-        if col in row and pd.notna(row[col]):
-            return str(row[col]).strip()
+# Accepted column-name variants for each rubric field
+_NAME_COLS = ["Criterion", "Criteria", "Parameter", "Aspect"]
+_DESC_COLS = ["Description", "Criteria Description", "Detail", "Details"]
+_KEYWORD_COLS = ["Keywords", "Keyword", "Key words", "KeyWords"]
+_WEIGHT_COLS = ["Weight", "Weights", "MaxScore"]
+_MIN_COLS = ["MinWords", "Min Words"]
+_MAX_COLS = ["MaxWords", "Max Words"]
 
-    # Fall back to the first non-null value in the row
-    for val in row:
-        if pd.notna(val):
-            return str(val).strip()
 
-    return "Unnamed Criterion"
+def _first_column(columns: set, candidates: List[str]):
+    """First candidate column name present in the rubric, else None."""
+    return next((c for c in candidates if c in columns), None)
 
 
-def _get_first_existing(row: pd.Series, candidates) -> Any:
-    for col in candidates:
-        if col in row:
-            return row[col]
-    return np.nan
+def _column_values(rubric_df: pd.DataFrame, col) -> List[Any]:
+    """One column as a plain list; all-NaN when the column is absent."""
+    if col is None:
+        return [np.nan] * len(rubric_df)
+    return rubric_df[col].tolist()
 
 
-def score_transcript(transcript: str, rubric_df: pd.DataFrame) -> Dict[str, Any]:
+def get_descriptions(rubric_df: pd.DataFrame) -> List[str]:
     """
-    Core function: given transcript text + rubric DataFrame,
-    returns overall score and per-criterion breakdown.
+    Extract the criterion description text for every rubric row;
+    missing/NaN cells become empty strings.
     """
-    transcript = preprocess_text(transcript)
-    words = transcript.split()
-    word_count = len(words)
+    desc_col = _first_column(set(rubric_df.columns), _DESC_COLS)
+    return [
+        "" if pd.isna(v) else str(v).strip()
+        for v in _column_values(rubric_df, desc_col)
+    ]
 
-    per_criterion_results: List[Dict[str, Any]] = []
-    weighted_sum = 0.0
-    total_weight = 0.0
 
-    for _, row in rubric_df.iterrows():
-        criterion_name = _get_criterion_name(row)
+def encode_descriptions(rubric_df: pd.DataFrame, model=None):
+    """
+    Encode all rubric descriptions into a stacked, L2-normalized
+    embedding matrix. Returns None if the model is unavailable.
 
-        description = _get_first_existing(
-            row,
-            ["Description", "Criteria Description", "Detail", "Details"],
-        )
+    The rubric is static for a session, so callers (e.g. the Streamlit
+    app) can cache this result and pass it into score_transcript to
+    avoid re-encoding the descriptions on every run.
+    """
+    if model is None:
+        model = load_model()
+    if model is None:
+        return None
+
+    descriptions = get_descriptions(rubric_df)
+    valid_idx = [i for i, desc in enumerate(descriptions) if desc]
+    if not valid_idx:
+        return None
+
+    valid_embs = model.encode(
+        [descriptions[i] for i in valid_idx],
+        batch_size=32,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+
+    # Rows without a description never reach the transformer; they keep a
+    # zero vector, whose dot product with any transcript embedding is 0 —
+    # exactly the neutral 0.5 after the 0..1 rescale.
+    embs = np.zeros((len(descriptions), valid_embs.shape[1]), dtype=valid_embs.dtype)
+    embs[valid_idx] = valid_embs
+    return embs
+
+
+@dataclass
+class Rubric:
+    """
+    Structure-of-arrays view of the rubric.
 
-        keywords = _get_first_existing(
-            row,
-            ["Keywords", "Keyword", "Key words", "KeyWords"],
-        )
+    Instead of walking heterogeneous DataFrame rows per scoring call,
+    each field lives in its own flat array/list, and the description
+    embeddings are precomputed once — the semantic stage then reduces
+    to a single matrix-vector product.
+    """
+
+    names: List[str]
+    descriptions: List[str]
+    keyword_lists: List[List[str]]
+    weights: np.ndarray
+    min_words: np.ndarray
+    max_words: np.ndarray
+    # (N, D), L2-normalized, stored as float16: half the memory traffic,
+    # and at 384 dims the similarity ranking is unaffected.
+    desc_embeddings: Optional[np.ndarray] = None
 
-        weight_raw = _get_first_existing(row, ["Weight", "Weights", "MaxScore"])
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def build_rubric(rubric_df: pd.DataFrame, desc_embs=None, model=None) -> Rubric:
+    """
+    Convert a rubric DataFrame into a Rubric, resolving the column-name
+    variants once and encoding all descriptions in one batched pass.
+    Callers (e.g. the Streamlit app) should cache the result per session.
+    """
+    cols = set(rubric_df.columns)
+    name_col = _first_column(cols, _NAME_COLS)
+    kw_col = _first_column(cols, _KEYWORD_COLS)
+    weight_col = _first_column(cols, _WEIGHT_COLS)
+    min_col = _first_column(cols, _MIN_COLS)
+    max_col = _first_column(cols, _MAX_COLS)
+
+    n_rows = len(rubric_df)
+    keyword_lists = [_parse_keywords(v) for v in _column_values(rubric_df, kw_col)]
+
+    weights = np.empty(n_rows)
+    for i, weight_raw in enumerate(_column_values(rubric_df, weight_col)):
         try:
-            weight = float(weight_raw) if pd.notna(weight_raw) else 1.0
+            weights[i] = float(weight_raw) if pd.notna(weight_raw) else 1.0
         except Exception:
-            weight = 1.0
-
-        min_words = _get_first_existing(row, ["MinWords", "Min Words"])
-        max_words = _get_first_existing(row, ["MaxWords", "Max Words"])
+            weights[i] = 1.0
+
+    # Ensure numeric
+    min_words = np.array(
+        [float(v) if pd.notna(v) else np.nan for v in _column_values(rubric_df, min_col)]
+    )
+    max_words = np.array(
+        [float(v) if pd.notna(v) else np.nan for v in _column_values(rubric_df, max_col)]
+    )
+
+    # Criterion names, falling back to the first non-null value in the
+    # row when the name cell is missing.
+    names: List[str] = []
+    fallback_rows = None
+    for i, v in enumerate(_column_values(rubric_df, name_col)):
+        if pd.notna(v):
+            names.append(str(v).strip())
+            continue
+        if fallback_rows is None:
+            fallback_rows = list(rubric_df.itertuples(index=False, name=None))
+        names.append(
+            next(
+                (str(x).strip() for x in fallback_rows[i] if pd.notna(x)),
+                "Unnamed Criterion",
+            )
+        )
 
-        # Ensure numeric
-        min_words = float(min_words) if pd.notna(min_words) else np.nan
-        max_words = float(max_words) if pd.notna(max_words) else np.nan
+    descriptions = get_descriptions(rubric_df)
+
+    if desc_embs is None:
+        desc_embs = encode_descriptions(rubric_df, model=model)
+    if desc_embs is not None:
+        desc_embs = np.ascontiguousarray(desc_embs, dtype=np.float16)
+
+    return Rubric(
+        names=names,
+        descriptions=descriptions,
+        keyword_lists=keyword_lists,
+        weights=weights,
+        min_words=min_words,
+        max_words=max_words,
+        desc_embeddings=desc_embs,
+    )
+
+
+def score_transcript(
+    transcript: str,
+    rubric,
+    desc_embs=None,
+    model=None,
+) -> Dict[str, Any]:
+    """
+    Core function: given transcript text + rubric,
+    returns overall score and per-criterion breakdown.
 
-        # Rule-based keyword coverage
-        kw_result = compute_keyword_score(transcript, keywords)
+    rubric: a Rubric from build_rubric (preferred — its description
+    embeddings are already in place), or a raw rubric DataFrame which is
+    converted on the fly; desc_embs optionally supplies a precomputed
+    embedding matrix for the DataFrame case. model: the encoder to use,
+    defaulting to the shared lazily-loaded instance.
+    """
+    if model is None:
+        model = load_model()
+    if isinstance(rubric, pd.DataFrame):
+        rubric = build_rubric(rubric, desc_embs=desc_embs, model=model)
 
-        # Semantic similarity
-        semantic = compute_semantic_score(transcript, description)
+    transcript = preprocess_text(transcript)
+    # Lowercase once up front; every case-insensitive lookup below
+    # reuses this single copy.
+    transcript_lower = transcript.lower()
+    words = transcript.split()
+    word_count = len(words)
+    n_rows = len(rubric)
 
-        # Length penalty
-        length_info = compute_length_penalty(word_count, min_words, max_words)
+    # Kick the transcript encode off on the worker thread first: the
+    # forward pass releases the GIL, so the keyword scan below runs
+    # concurrently with it.
+    if model is None or rubric.desc_embeddings is None or n_rows == 0:
+        encode_future = None
+    else:
+        encode_future = _encode_executor.submit(
+            _encode_transcript, model, transcript
+        )
 
-        # Combine rule-based + semantic (50%-50% here, tunable)
-        base_score = 0.5 * kw_result["score"] + 0.5 * semantic
+    # Scan the transcript ONCE for the union of all rubric keywords
+    # (Aho–Corasick when available), instead of once per keyword.
+    found_sets = _find_all_keywords(transcript_lower, rubric.keyword_lists)
+    kw_results = [
+        _coverage_result(rubric.keyword_lists[i], found_sets[i])
+        for i in range(n_rows)
+    ]
+    kw_scores = np.array([r["score"] for r in kw_results])
 
-        # Apply length penalty
-        final_score_0_1 = base_score * length_info["penalty"]
+    # Semantic similarity: one transcript encode, then one matvec against
+    # the precomputed description matrix (unit-norm, so the dot product
+    # is already the cosine similarity; -1..1 → 0..1)
+    if encode_future is None:
+        sem_scores = np.full(n_rows, 0.5)
+    else:
+        transcript_emb = encode_future.result()
+        # Upcast the half-precision matrix once per call so the matvec
+        # accumulates in float32.
+        desc_embs_f32 = rubric.desc_embeddings.astype(np.float32)
+        sem_scores = 0.5 * (desc_embs_f32 @ transcript_emb.astype(np.float32)) + 0.5
+
+    # Length penalties + 50/50 blend + weighting, one native pass
+    penalties, finals, weighted_sum, total_weight = _length_penalty_and_combine(
+        float(word_count),
+        rubric.min_words,
+        rubric.max_words,
+        kw_scores,
+        np.asarray(sem_scores, dtype=np.float64),
+        rubric.weights,
+    )
+
+    # One vectorized rounding pass for all numeric columns, instead of
+    # four Python-level round() calls per criterion.
+    rounded = np.round(
+        np.stack([kw_scores, np.asarray(sem_scores, dtype=np.float64), penalties, finals]),
+        3,
+    ).T.tolist()
 
-        # Weighting
-        weighted = final_score_0_1 * weight
-        weighted_sum += weighted
-        total_weight += weight
+    per_criterion_results: List[Dict[str, Any]] = []
+    for i in range(n_rows):
+        # Penalty < 1 exactly when a bound was violated, so only those
+        # rows need the suggestion text.
+        if penalties[i] < 1.0:
+            suggestion = compute_length_penalty(
+                word_count, rubric.min_words[i], rubric.max_words[i]
+            )["suggestion"]
+        else:
+            suggestion = ""
 
+        kw_r, sem_r, pen_r, fin_r = rounded[i]
         per_criterion_results.append(
             {
-                "criterion": criterion_name,
-                "weight": weight,
-                "keyword_score": round(kw_result["score"], 3),
-                "semantic_score": round(semantic, 3),
-                "length_penalty": round(length_info["penalty"], 3),
-                "final_score_0_1": round(final_score_0_1, 3),
-                "keywords_found": kw_result["found"],
-                "keywords_missing": kw_result["missing"],
-                "length_feedback": length_info["suggestion"],
+                "criterion": rubric.names[i],
+                "weight": float(rubric.weights[i]),
+                "keyword_score": kw_r,
+                "semantic_score": sem_r,
+                "length_penalty": pen_r,
+                "final_score_0_1": fin_r,
+                "keywords_found": kw_results[i]["found"],
+                "keywords_missing": kw_results[i]["missing"],
+                "length_feedback": suggestion,
             }
         )
 